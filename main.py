@@ -1,5 +1,4 @@
 from concurrent.futures import ThreadPoolExecutor as ThreadPoolExecutor
-from csv import DictReader
 from datetime import datetime
 from logging import (
     DEBUG,
@@ -14,16 +13,19 @@ from pathlib import Path
 from smtplib import SMTP
 from sys import stderr
 from typing import (
+    Annotated,
     Any,
     override,
 )
 from uuid import uuid4
 
 from dotenv import load_dotenv
-from pydantic import (
-    BaseModel,
-    EmailStr,
+from msgspec import (
+    Meta,
+    Struct,
+    convert,
 )
+from polars import read_csv
 
 from mailcast.helpers.email_builder import Mailer
 from mailcast.helpers.mailing_list import MailingList
@@ -91,9 +93,13 @@ stream_handler.setLevel(DEBUG)
 logger.addHandler(stream_handler)
 
 
-class Recipient(BaseModel):
+# addr-spec: https://datatracker.ietf.org/doc/html/rfc5322#section-3.4.1
+EmailAddress = Annotated[str, Meta(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")]
+
+
+class Recipient(Struct):
     personal_name: str
-    email_address: EmailStr
+    email_address: EmailAddress
 
 
 def main():
@@ -108,8 +114,10 @@ def main():
         logger=logger,
     )
 
-    for row in DictReader(Path("list.csv").open("r", encoding="utf-8-sig")):
-        recipient = Recipient.model_validate(row)
+    rows = read_csv("list.csv", encoding="utf8-lossy", infer_schema=False, empty_string_is_null=False)
+    recipients = convert(rows.to_dicts(), list[Recipient])
+
+    for recipient in recipients:
         mailer = Mailer(recipient.email_address, config)
 
         mailing_list.register(
@@ -118,11 +126,15 @@ def main():
             mailer.message,
         )
 
-    with SMTP(env.smtp_hostname, env.smtp_port) as smtp:
+    def connect() -> SMTP:
+        smtp = SMTP(env.smtp_hostname, env.smtp_port)
         smtp.ehlo_or_helo_if_needed()
         smtp.starttls()
         smtp.login(env.smtp_username, env.smtp_password.get_secret_value())
-        mailing_list.send(smtp)
+
+        return smtp
+
+    mailing_list.send(connect)
 
 
 if __name__ == "__main__":
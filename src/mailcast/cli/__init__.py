@@ -18,6 +18,7 @@ typer.add_typer(schema_typer)
 def register(
     specification_file: Annotated[Path, Argument(exists=True, dir_okay=False)],
     interactive: Annotated[bool, Option()] = False,
+    concurrency: Annotated[int, Option(min=1, help="Number of concurrent SMTP connections")] = 1,
 ) -> None:
     from email.mime.text import MIMEText
     from os import getenv
@@ -32,13 +33,20 @@ def register(
         SecretStr,
     )
     from pydantic_extra_types.domain import DomainStr
-    from yaml import safe_load
+    from yaml import load
+
+    try:
+        from yaml import (
+            CSafeLoader as SafeLoader,
+        )
+    except ImportError:
+        from yaml import SafeLoader
 
     from mailcast.lib.message.mailing_list import MailingList
     from mailcast.lib.specification import Specification
 
     specification_text = specification_file.read_text()
-    specification = Specification.model_validate(safe_load(specification_text))
+    specification = Specification.model_validate(load(specification_text, Loader=SafeLoader))
 
     SMTP_HOSTNAME = TypeAdapter(DomainStr).validate_python(getenv("SMTP_HOSTNAME"))
     SMTP_PORT = TypeAdapter(NonNegativeInt).validate_python(getenv("SMTP_PORT"))
@@ -55,11 +63,15 @@ def register(
         MIMEText("Test"),
     )
 
-    with SMTP(SMTP_HOSTNAME, SMTP_PORT) as smtp:
+    def connect() -> SMTP:
+        smtp = SMTP(SMTP_HOSTNAME, SMTP_PORT)
         smtp.ehlo_or_helo_if_needed()
         smtp.starttls()
         smtp.login(SMTP_USERNAME, SMTP_PASSWORD.get_secret_value())
-        mailing_list.send(smtp)
+
+        return smtp
+
+    mailing_list.send(connect, concurrency=concurrency)
 
 
 @typer.callback()
@@ -1,18 +1,20 @@
 from collections.abc import Sequence
-from email.encoders import encode_base64
+from copy import deepcopy
+from email.message import Message
 from email.mime.multipart import MIMEMultipart
 from email.mime.nonmultipart import MIMENonMultipart
 from email.mime.text import MIMEText
 from email.utils import make_msgid
+from functools import lru_cache
 from mimetypes import (
     guess_extension,
     guess_file_type,
 )
 from pathlib import Path
 from string import Template
+from typing import NamedTuple
 from urllib.parse import quote
 
-from html_to_markdown import convert_to_markdown
 from icalendar import (
     Calendar,
     Event,
@@ -28,9 +30,31 @@ from ..specification.message import (
     AttachmentFile,
     InlineAttachmentContent,
     InlineAttachmentFile,
-    TemplateContent,
-    TemplateFile,
 )
+from .plaintext import to_plaintext
+
+try:
+    from pybase64 import encodebytes
+except ImportError:
+    from base64 import encodebytes
+
+
+@lru_cache(maxsize=512)
+def guess_type(path: Path) -> tuple[str | None, str | None]:
+    file_type, _ = guess_file_type(path)
+
+    return (*file_type.split("/", 1), None)[:2] if file_type else (None, None)
+
+
+@lru_cache(maxsize=512)
+def guess_suffix(file_type: str) -> str:
+    return guess_extension(file_type) or ""
+
+
+class Skeleton(NamedTuple):
+    message: MIMEMultipart
+    html: Template
+    text: Template
 
 
 class EmailBuilder:
@@ -41,16 +65,57 @@ class EmailBuilder:
         email_address: str,  # TODO
         specification: Specification,
     ):
-        template = specification.message.template
+        skeleton = specification.skeleton
+        mapping = dict(email_address=quote(email_address))  # TODO
 
-        mixed_message = self.__class__.seal_mixed_message(specification.message.attachments)
-        alternative_message = self.__class__.seal_alternative_message(email_address, template)
+        mixed_message = deepcopy(skeleton.message)
+        alternative_message = mixed_message.get_payload(-1)
+        text, related_message = alternative_message.get_payload()
+        html = related_message.get_payload(0)
 
-        mixed_message.attach(alternative_message)
+        self.__class__.fill(text, skeleton.text.safe_substitute(mapping))
+        self.__class__.fill(html, skeleton.html.safe_substitute(mapping))
 
         self.message = mixed_message
         self.specification = specification
 
+    @classmethod
+    def build_skeleton(cls, specification: Specification) -> Skeleton:
+        template = specification.message.template
+
+        if isinstance(template, Path):
+            content = template.read_text("utf-8")
+            plaintext = to_plaintext(content)
+            inline_attachments = None
+        else:
+            content = template.source
+            plaintext = template.plaintext
+            inline_attachments = template.inline_attachments
+
+        mixed_message = cls.seal_mixed_message(specification.message.attachments)
+        alternative_message = cls.seal_alternative_message(inline_attachments)
+
+        mixed_message.attach(alternative_message)
+
+        return Skeleton(
+            message=mixed_message,
+            html=Template(content),
+            text=Template(plaintext),
+        )
+
+    @classmethod
+    def fill(cls, part: Message, content: str) -> None:
+        del part["Content-Transfer-Encoding"]
+
+        part.set_payload(content, "utf-8")
+
+    @classmethod
+    def encode(cls, part: Message, payload: bytes) -> None:
+        # https://datatracker.ietf.org/doc/html/rfc2045#section-6.8
+        part["Content-Transfer-Encoding"] = "base64"
+
+        part.set_payload(encodebytes(payload).decode("ascii"))
+
     @classmethod
     def seal_related_message(
         cls,
@@ -63,13 +128,13 @@ class EmailBuilder:
         message.attach(html)
 
         for inline_attachment in inline_attachments or []:
-            file_type = (*inline_attachment.type.split("/", 1), None)[:2] if inline_attachment.type else (None, None)
+            file_type = inline_attachment.mime_pair
 
             if isinstance(inline_attachment, InlineAttachmentFile):
                 payload = inline_attachment.file.read_bytes()
 
                 if file_type == (None, None):
-                    file_type = guess_file_type(inline_attachment.file)
+                    file_type = guess_type(inline_attachment.file)
             else:
                 payload = inline_attachment.content.encode("utf-8")
 
@@ -81,8 +146,7 @@ class EmailBuilder:
             part = MIMENonMultipart(_type, _subtype)
             part["Content-ID"] = inline_attachment.content_id or make_msgid()  # TODO
 
-            part.set_payload(payload)
-            encode_base64(part)
+            cls.encode(part, payload)
             message.attach(part)
 
         return message
@@ -90,27 +154,11 @@ class EmailBuilder:
     @classmethod
     def seal_alternative_message(
         cls,
-        email_address: str,
-        template: TemplateFile | TemplateContent | FilePath,
+        inline_attachments: Sequence[InlineAttachmentFile | InlineAttachmentContent] | None = None,
     ) -> MIMEMultipart:
         message = MIMEMultipart("alternative")  # multipart/alternative
-
-        if isinstance(template, Path):
-            content = template.read_text("utf-8")
-            inline_attachments = None
-        elif isinstance(template, TemplateFile):
-            content = template.file.read_text("utf-8")
-            inline_attachments = template.inline_attachments
-        else:
-            content = template.content
-            inline_attachments = template.inline_attachments
-
-        content = Template(content).safe_substitute(dict(email_address=quote(email_address)))  # TODO
-        text = MIMEText(convert_to_markdown(content, strip=("table", "tr", "th", "td")), "plain", "utf-8")
-        related_message = cls.seal_related_message(
-            content,
-            inline_attachments,
-        )
+        text = MIMEText("", "plain", "utf-8")
+        related_message = cls.seal_related_message("", inline_attachments)
 
         message.attach(text)
         message.attach(related_message)
@@ -129,17 +177,17 @@ class EmailBuilder:
 
             if isinstance(attachment, Path):
                 file_stem = attachment.stem
-                file_type = guess_file_type(attachment)
+                file_type = guess_type(attachment)
                 payload = attachment.read_bytes()
             else:
-                file_type = (*attachment.type.split("/", 1), None)[:2] if attachment.type else (None, None)
+                file_type = attachment.mime_pair
 
                 if isinstance(attachment, AttachmentFile):
                     file_stem = attachment.file.stem
                     payload = attachment.file.read_bytes()
 
                     if file_type == (None, None):
-                        file_type = guess_file_type(attachment.file)
+                        file_type = guess_type(attachment.file)
                 elif isinstance(attachment, AttachmentCalendar):
                     organizer = vCalAddress("MAILTO:evs_service@mail.moe.gov.tw")
                     calendar = Calendar()
@@ -167,12 +215,11 @@ class EmailBuilder:
                 _type, _subtype = "application", "octet-stream"
 
             part = MIMENonMultipart(_type, _subtype)
-            file_extension = guess_extension(f"{_type}/{_subtype}") or ""
+            file_extension = guess_suffix(f"{_type}/{_subtype}")
             file_name = f"{file_stem}{file_extension}"
 
             part.add_header("Content-Disposition", "attachment", filename=file_name)
-            part.set_payload(payload)
-            encode_base64(part)
+            cls.encode(part, payload)
             message.attach(part)
 
         return message
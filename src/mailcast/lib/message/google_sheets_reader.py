@@ -3,6 +3,7 @@ from http import (
     HTTPMethod,
     HTTPStatus,
 )
+from io import TextIOWrapper
 from typing import ClassVar
 from urllib.request import (
     Request,
@@ -39,4 +40,4 @@ class GoogleSheetsReader(DictReader):
         new_request = Request(url=new_url, method=HTTPMethod.GET)
         new_response = opener.open(new_request)
 
-        super().__init__(new_response.read())
+        super().__init__(TextIOWrapper(new_response, encoding="utf-8-sig", newline=""))
@@ -1,13 +1,33 @@
-from collections.abc import Sequence
-from email import message_from_bytes
+from collections.abc import (
+    Callable,
+    Iterator,
+    Sequence,
+)
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from copy import (
+    copy,
+    deepcopy,
+)
+from email.generator import BytesGenerator
 from email.message import Message
 from email.utils import (
     formataddr,
-    make_msgid,
+    getaddresses,
 )
+from io import BytesIO
+from itertools import count
+from queue import Queue
+from secrets import token_hex
 from smtplib import (
     SMTP,
-    SMTPException,
+    SMTPRecipientsRefused,
+    SMTPResponseException,
+    SMTPServerDisconnected,
+)
+from time import (
+    sleep,
+    time,
 )
 from typing import (
     Literal,
@@ -15,11 +35,16 @@ from typing import (
 )
 from uuid import uuid4
 
+from loguru import logger
+
 AddressPair = tuple[str | None, str]
 Importance = Literal["low", "normal", "high"]
 Priority = Literal["non-urgent", "normal", "urgent"]
 Sensitivity = Literal["personal", "private", "company confidential"]
 
+# https://datatracker.ietf.org/doc/html/rfc5321#section-4.2.3
+TRANSIENT_REPLY_CODES = frozenset({421, 450, 451, 452, 454})
+
 
 class MailingList:
     collection: list[Message]
@@ -31,6 +56,15 @@ class MailingList:
     identifier: AddressPair
     namespace: str
 
+    author_header: str
+    sender_header: str
+    originator_header: str
+    contact_header: str | None
+    identifier_header: str
+
+    message_id_prefix: str
+    message_id_counter: Iterator[int]
+
     def __init__(
         self,
         originator: AddressPair,
@@ -47,9 +81,18 @@ class MailingList:
         self.author = author or originator
         self.sender = sender or originator
         self.contact = contact
-        self.namespace = namespace or originator[1].rsplit("@", 1)[0]
+        self.namespace = namespace or originator[1].rsplit("@", 1)[-1]
         self.identifier = identifier or (None, f"{uuid4().hex}.")
 
+        self.author_header = formataddr(self.author)
+        self.sender_header = formataddr(self.sender)
+        self.originator_header = formataddr(self.originator)
+        self.contact_header = formataddr(self.contact) if self.contact else None
+        self.identifier_header = formataddr(self.identifier)
+
+        self.message_id_prefix = f"{int(time())}.{token_hex(8)}"
+        self.message_id_counter = count()
+
     def __iter__(self):
         return iter(self.collection)
 
@@ -68,49 +111,138 @@ class MailingList:
         if (original or carbon_copy or blind_carbon_copy) is None:
             raise ValueError("At least one recipient must be specified")
 
-        copy = message_from_bytes(message.as_bytes())
+        sealed = deepcopy(message)
 
-        copy.add_header("From", formataddr(self.author))
-        copy.add_header("Sender", formataddr(self.sender))
-        copy.add_header("Return-Path", formataddr(self.originator))
+        sealed.add_header("From", self.author_header)
+        sealed.add_header("Sender", self.sender_header)
+        sealed.add_header("Return-Path", self.originator_header)
 
         if original:
-            copy.add_header("To", formataddr(original))
+            sealed.add_header("To", formataddr(original))
 
         if carbon_copy:
-            copy.add_header("Cc", formataddr(original))
+            sealed.add_header("Cc", formataddr(original))
 
         if blind_carbon_copy:
-            copy.add_header("Bcc", formataddr(original))
+            sealed.add_header("Bcc", formataddr(original))
 
-        copy.add_header("Subject", subject)
-        copy.add_header("List-ID", formataddr(self.identifier))
-        copy.add_header("Message-ID", make_msgid(domain=self.domain))
-        copy.add_header("Importance", importance)
-        copy.add_header("Priority", priority)
-        copy.add_header("Sensitivity", sensitivity)
+        sealed.add_header("Subject", subject)
+        sealed.add_header("List-ID", self.identifier_header)
+        # https://datatracker.ietf.org/doc/html/rfc5322#section-3.6.4
+        sealed.add_header("Message-ID", f"<{self.message_id_prefix}.{next(self.message_id_counter)}@{self.namespace}>")
+        sealed.add_header("Importance", importance)
+        sealed.add_header("Priority", priority)
+        sealed.add_header("Sensitivity", sensitivity)
 
-        if self.contact:
-            copy.add_header("Reply-To", formataddr(self.contact))
+        if self.contact_header:
+            sealed.add_header("Reply-To", self.contact_header)
 
-        self.collection.append(copy)
+        self.collection.append(sealed)
 
         return self
 
-    def send(self, smtp: SMTP) -> None:
+    @classmethod
+    def flatten(cls, message: Message) -> tuple[str, list[str], bytes, tuple[str, ...]]:
+        # https://datatracker.ietf.org/doc/html/rfc5321#section-3.3
+        sender = getaddresses([message["Sender"] or message["From"]])[0][1]
+        recipients = [
+            address
+            for _, address in getaddresses(
+                [*message.get_all("To", []), *message.get_all("Cc", []), *message.get_all("Bcc", [])]
+            )
+        ]
+
+        # https://datatracker.ietf.org/doc/html/rfc6531#section-3.4
+        international = not all(address.isascii() for address in (sender, *recipients))
+        policy = message.policy.clone(utf8=True) if international else message.policy
+        options = ("SMTPUTF8", "BODY=8BITMIME") if international else ()
+
+        visible = copy(message)
+        del visible["Bcc"]
+
+        buffer = BytesIO()
+        BytesGenerator(buffer, policy=policy).flatten(visible, linesep="\r\n")
+
+        return sender, recipients, buffer.getvalue(), options
+
+    def send(
+        self,
+        factory: Callable[[], SMTP],
+        *,
+        concurrency: int = 1,
+        retries: int = 3,
+        backoff: float = 1.0,
+    ) -> None:
         if len(self.collection) < 1:
             logger.warning("No message was sent due to empty message queue")
 
             return
 
-        smtp.ehlo_or_helo_if_needed()
+        workers = max(1, min(concurrency, len(self.collection)))
+        pool: Queue[SMTP] = Queue()
 
-        for message in self.collection:
+        def deliver(message: Message) -> None:
             recipient = message["To"]  # TODO
+            sender, recipients, data, options = self.__class__.flatten(message)
+            smtp = pool.get()
 
             try:
-                smtp.rset()
-                smtp.send_message(message)
-                logger.info("Sent message successfully", recipient=recipient)
-            except SMTPException as exception:
+                for attempt in range(retries + 1):
+                    try:
+                        smtp.sendmail(sender, recipients, data, options)
+                        logger.info("Sent message successfully", recipient=recipient)
+
+                        return
+                    except SMTPServerDisconnected:
+                        if attempt == retries:
+                            raise
+
+                        smtp = factory()
+                    except SMTPResponseException as exception:
+                        if exception.smtp_code not in TRANSIENT_REPLY_CODES or attempt == retries:
+                            raise
+
+                        sleep(backoff * 2**attempt)
+
+                        # https://datatracker.ietf.org/doc/html/rfc5321#section-3.8
+                        if exception.smtp_code == 421:
+                            smtp = factory()
+                    except SMTPRecipientsRefused as exception:
+                        refused = exception.recipients
+                        transient = [address for address, (code, _) in refused.items() if code in TRANSIENT_REPLY_CODES]
+
+                        if not transient or attempt == retries:
+                            raise
+
+                        if len(transient) < len(refused):
+                            logger.error(
+                                "Failed to send message",
+                                recipient=recipient,
+                                exception=SMTPRecipientsRefused(
+                                    {address: reply for address, reply in refused.items() if address not in transient}
+                                ),
+                            )
+
+                        recipients = transient
+
+                        sleep(backoff * 2**attempt)
+
+                        # https://datatracker.ietf.org/doc/html/rfc5321#section-3.8
+                        if any(code == 421 for code, _ in refused.values()):
+                            smtp = factory()
+            except OSError as exception:
                 logger.error("Failed to send message", recipient=recipient, exception=exception)
+            finally:
+                pool.put(smtp)
+
+        try:
+            for _ in range(workers):
+                pool.put(factory())
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for _ in executor.map(deliver, self.collection):
+                    pass
+        finally:
+            while not pool.empty():
+                with suppress(OSError):
+                    pool.get_nowait().quit()
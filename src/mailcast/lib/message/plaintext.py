@@ -0,0 +1,121 @@
+from html.parser import HTMLParser
+from itertools import groupby
+from operator import itemgetter
+from re import compile
+from typing import override
+
+# https://html.spec.whatwg.org/multipage/syntax.html#elements-2
+BLOCK_TAGS = frozenset(
+    {
+        "address",
+        "blockquote",
+        "br",
+        "div",
+        "dl",
+        "dt",
+        "dd",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "hr",
+        "li",
+        "ol",
+        "p",
+        "pre",
+        "table",
+        "tr",
+        "ul",
+    }
+)
+CELL_TAGS = frozenset({"td", "th"})
+SKIPPED_TAGS = frozenset({"head", "script", "style", "template", "title"})
+WHITESPACE = compile(r"\s+")
+
+
+class PlaintextExtractor(HTMLParser):
+    chunks: list[tuple[str, bool]]
+    links: list[str | None]
+    skipped: int
+    preformatted: int
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.chunks = []
+        self.links = []
+        self.skipped = 0
+        self.preformatted = 0
+
+    @property
+    def text(self) -> str:
+        lines: list[str] = []
+
+        for preformatted, group in groupby(self.chunks, key=itemgetter(1)):
+            for line in "".join(chunk for chunk, _ in group).splitlines():
+                if preformatted:
+                    lines.append(line.rstrip())
+                elif (line := line.strip()) or (lines and lines[-1]):
+                    lines.append(line)
+
+        return "\n".join(lines).strip("\n")
+
+    @override
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in SKIPPED_TAGS:
+            self.skipped += 1
+        elif self.skipped:
+            return
+        elif tag == "a":
+            self.links.append(dict(attrs).get("href"))
+        elif tag == "img":
+            self.chunks.append((dict(attrs).get("alt") or "", False))
+        elif tag in CELL_TAGS:
+            self.chunks.append((" ", False))
+        elif tag in BLOCK_TAGS:
+            self.chunks.append(("\n", False))
+
+        if tag == "pre" and not self.skipped:
+            self.preformatted += 1
+
+    @override
+    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self.handle_starttag(tag, attrs)
+
+    @override
+    def handle_endtag(self, tag: str) -> None:
+        if tag in SKIPPED_TAGS:
+            self.skipped = max(0, self.skipped - 1)
+        elif self.skipped:
+            return
+        elif tag == "a":
+            href = self.links.pop() if self.links else None
+
+            if href and not href.startswith("#"):
+                self.chunks.append((f" <{href}>", False))
+        elif tag == "pre":
+            self.preformatted = max(0, self.preformatted - 1)
+
+        if tag in BLOCK_TAGS and not self.skipped:
+            self.chunks.append(("\n", False))
+
+    @override
+    def handle_data(self, data: str) -> None:
+        if self.skipped:
+            return
+
+        if self.preformatted:
+            self.chunks.append((data, True))
+        else:
+            self.chunks.append((WHITESPACE.sub(" ", data), False))
+
+
+def to_plaintext(content: str) -> str:
+    extractor = PlaintextExtractor()
+
+    extractor.feed(content)
+    extractor.close()
+
+    return extractor.text
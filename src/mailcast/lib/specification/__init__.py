@@ -1,9 +1,21 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
 from pydantic import BaseModel
 
 from .mailing_list import MailingList
 from .message import Message
 
+if TYPE_CHECKING:
+    from ..message.email_builder import Skeleton
+
 
 class Specification(BaseModel):
     mailing_list: MailingList
     message: Message
+
+    @cached_property
+    def skeleton(self) -> "Skeleton":
+        from ..message.email_builder import EmailBuilder
+
+        return EmailBuilder.build_skeleton(self)
@@ -1,7 +1,11 @@
-from abc import ABC
+from abc import (
+    ABC,
+    abstractmethod,
+)
 from collections.abc import Sequence
 from datetime import datetime
 from email.utils import formataddr
+from functools import cached_property
 from typing import (
     Annotated,
     Literal,
@@ -18,6 +22,7 @@ from pydantic import (
     InstanceOf,
     PlainSerializer,
     PlainValidator,
+    computed_field,
 )
 from pydantic.networks import (
     EmailStr,
@@ -28,6 +33,7 @@ from pydantic.types import (
     FilePath,
 )
 
+from ..message.plaintext import to_plaintext
 from .rfc import (
     ListIdentifier,
     MIMEEntity,
@@ -88,6 +94,11 @@ class MessageHeaders(BaseModel, extra="allow"):
 class Attachment[T: str | None](MIMEEntity[T], ABC):
     name: str
 
+    @computed_field
+    @cached_property
+    def mime_pair(self) -> tuple[str | None, str | None]:
+        return (*self.type.split("/", 1), None)[:2] if self.type else (None, None)
+
 
 class AttachmentFile(Attachment[str | None]):
     file: FilePath
@@ -110,14 +121,32 @@ class InlineAttachmentContent(AttachmentContent, InlineAttachment): ...
 class Template(MIMEEntity[Literal["text/html", "text/plain"]], ABC):
     inline_attachments: Sequence[InlineAttachmentFile | InlineAttachmentContent] | None = Field(default=None)
 
+    @property
+    @abstractmethod
+    def source(self) -> str: ...
+
+    @cached_property
+    def plaintext(self) -> str:
+        return to_plaintext(self.source)
+
 
 class TemplateFile(Template):
     file: FilePath
 
+    @cached_property
+    @override
+    def source(self) -> str:
+        return self.file.read_text("utf-8")
+
 
 class TemplateContent(Template):
     content: Base64UrlStr | str
 
+    @cached_property
+    @override
+    def source(self) -> str:
+        return self.content
+
 
 class AttachmentCalendar(Attachment[Literal["text/calendar"]]):
     summary: str